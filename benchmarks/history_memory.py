@@ -0,0 +1,74 @@
+"""Compare memory per History entry for plain dicts and HistoryEntry.
+
+Usage: python benchmarks/history_memory.py [count]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from history import History, HistoryEntry
+
+OPERATIONS = ['+', '-', '*', '/', 'sin', 'cos', 'sqrt', 'log']
+
+
+def build_dicts(count):
+    # Baseline representation: one dict and one operands list per entry.
+    # ''.join() builds a fresh string each time, like values parsed from
+    # user input, so both builders pay for their own operation strings.
+    entries = []
+    for i in range(count):
+        entries.append({
+            'timestamp': datetime.now().isoformat(),
+            'operation': ''.join(OPERATIONS[i % len(OPERATIONS)]),
+            'operands': [float(i), 2.0],
+            'result': float(i) * 2.0,
+            'mode': ''.join('basic')
+        })
+    return entries
+
+
+def build_entries(count):
+    entries = []
+    for i in range(count):
+        entries.append(HistoryEntry(
+            time.time(),
+            ''.join(OPERATIONS[i % len(OPERATIONS)]),
+            [float(i), 2.0],
+            float(i) * 2.0,
+            ''.join('basic')
+        ))
+    return entries
+
+
+def measure(builder, count):
+    tracemalloc.start()
+    entries = builder(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entries
+    return current / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    before = measure(build_dicts, count)
+    after = measure(build_entries, count)
+    print(f"entries:          {count}")
+    print(f"dict entry:       {before:.1f} bytes/entry")
+    print(f"HistoryEntry:     {after:.1f} bytes/entry")
+    print(f"reduction:        {100 * (1 - after / before):.1f}%")
+
+    hist = History(max_entries=count)
+    start = time.perf_counter()
+    for i in range(count):
+        hist.add_entry('+', [i, 2], i + 2.0)
+    elapsed = time.perf_counter() - start
+    print(f"History.add_entry: {1e9 * elapsed / count:.0f} ns/entry")
+
+
+if __name__ == '__main__':
+    main()
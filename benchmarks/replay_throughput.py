@@ -0,0 +1,54 @@
+"""Measure replay_history throughput for 1..N worker processes.
+
+Usage: python benchmarks/replay_throughput.py [entries] [max_processes]
+"""
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from calculator import Calculator
+from history import History
+from replay import replay_history
+
+BASIC = ['+', '-', '*', '/', '^', '%']
+SCIENTIFIC = ['sin', 'cos', 'tan', 'log', 'ln', 'sqrt', 'exp']
+PROGRAMMER = ['bin', 'hex', 'oct', 'and', 'or', 'xor', 'shift_left', 'shift_right']
+
+
+def write_history(path, count):
+    calc = Calculator()
+    rng = random.Random(0)
+    hist = History(max_entries=count)
+    for _ in range(count):
+        mode = rng.choice(['basic', 'scientific', 'programmer'])
+        if mode == 'basic':
+            a, b, op = rng.uniform(0, 100), rng.uniform(1, 5), rng.choice(BASIC)
+            hist.add_entry(op, [a, b], calc.basic_operations(a, b, op), mode)
+        elif mode == 'scientific':
+            v, op = rng.uniform(0.1, 50), rng.choice(SCIENTIFIC)
+            hist.add_entry(op, [v], calc.scientific_operations(v, op), mode)
+        else:
+            v, op = rng.randint(0, 1 << 16), rng.choice(PROGRAMMER)
+            hist.add_entry(op, [v], calc.programmer_operations(v, op), mode)
+    hist.export_history(path)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    max_processes = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'history.json')
+        write_history(path, count)
+        processes = 1
+        while processes <= max_processes:
+            report = replay_history(path, processes=processes)
+            print(f"processes={processes:<3} {report['entries_per_second']:>12,.0f} entries/s "
+                  f"mismatches={len(report['mismatches'])}")
+            processes *= 2
+
+
+if __name__ == '__main__':
+    main()
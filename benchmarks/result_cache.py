@@ -0,0 +1,63 @@
+"""Startup-to-first-hit latency and hit ratio of ResultCache in fresh processes.
+
+A first process warms the cache file; each following process starts cold
+in memory and replays a random sample from the same key space.
+
+Usage: python benchmarks/result_cache.py [workers] [calls]
+"""
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC)
+
+from calculator import Calculator
+from result_cache import ResultCache
+
+# The scientific operation Calculator caches; the others skip the cache
+OPERATIONS = ['factorial']
+
+
+def workload(seed, calls):
+    rng = random.Random(seed)
+    for _ in range(calls):
+        if rng.random() < 0.5:
+            yield 'expr', f"{rng.randint(1, 50)} * ({rng.randint(1, 50)} + {rng.randint(1, 50)})"
+        else:
+            yield rng.choice(OPERATIONS), float(rng.randint(1, 200))
+
+
+def run_worker(path, seed, calls):
+    started = time.perf_counter()
+    calc = Calculator(cache=ResultCache(path))
+    for operation, arg in workload(seed, calls):
+        if operation == 'expr':
+            calc.evaluate_expression(arg)
+        else:
+            calc.scientific_operations(arg, operation)
+    elapsed = time.perf_counter() - started
+    stats = calc.cache.get_statistics()
+    latency = stats['first_hit_latency']
+    latency_text = f"{1e3 * latency:.2f} ms" if latency is not None else "n/a"
+    print(f"seed={seed:<3} hit_ratio={stats['hit_ratio']:.3f} first_hit={latency_text:>9} "
+          f"{calls / elapsed:>9,.0f} calls/s")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        run_worker(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+        return
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results.db')
+        for seed in range(workers + 1):
+            subprocess.run([sys.executable, __file__, '--worker', path, str(seed), str(calls)], check=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Memory per session and lookup latency for SessionManager at 100k sessions.
+
+Memory is compared twice: with no History in use, and with a History
+created for every session. Session Histories only create their quantile
+sketches when statistics are first requested, and spilled sessions keep
+only their retained History entries, so the sketches restart on reload.
+
+Usage: python benchmarks/sessions.py [sessions]
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from calculator import Calculator
+from history import History
+from sessions import SessionManager
+
+
+def per_session_bytes(build, count):
+    tracemalloc.start()
+    held = build(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current / count
+
+
+def build_full_objects(count):
+    # Baseline: one Calculator and one History per user
+    return {f"user{i}": (Calculator(), History()) for i in range(count)}
+
+
+def build_manager(count):
+    manager = SessionManager(max_sessions=count)
+    for i in range(count):
+        with manager.session(f"user{i}") as calc:
+            calc.memory_operations('store', float(i))
+    return manager
+
+
+def build_manager_with_history(count):
+    manager = build_manager(count)
+    for i in range(count):
+        manager.history(f"user{i}")
+    return manager
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"sessions:               {count}")
+    print(f"Calculator + History:   {per_session_bytes(build_full_objects, count):.0f} bytes/session")
+    print(f"SessionManager:         {per_session_bytes(build_manager, count):.0f} bytes/session")
+    print(f"SessionManager+History: {per_session_bytes(build_manager_with_history, count):.0f} bytes/session")
+
+    manager = build_manager(count)
+    rng = random.Random(0)
+    ids = [f"user{rng.randrange(count)}" for _ in range(200_000)]
+    start = time.perf_counter()
+    for session_id in ids:
+        with manager.session(session_id) as calc:
+            pass
+    elapsed = time.perf_counter() - start
+    print(f"session() lookup:       {1e9 * elapsed / len(ids):.0f} ns/lookup")
+
+
+if __name__ == '__main__':
+    main()
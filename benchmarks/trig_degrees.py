@@ -0,0 +1,58 @@
+"""Compare degree-native trig with the previous math.sin(math.radians(x)) path.
+
+Usage: python benchmarks/trig_degrees.py [count]
+"""
+import math
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from calculator import Calculator
+
+
+class RadianCalculator(Calculator):
+    """The previous scientific_operations trig path, for comparison"""
+
+    def scientific_operations(self, value, operation):
+        if operation == 'sin':
+            result = math.sin(math.radians(value))
+        elif operation == 'cos':
+            result = math.cos(math.radians(value))
+        elif operation == 'tan':
+            result = math.tan(math.radians(value))
+        else:
+            return super().scientific_operations(value, operation)
+        self.last_result = result
+        return result
+
+
+def best(stmt, number=20):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rng = random.Random(0)
+    inputs = {
+        'typical': [rng.uniform(-720, 720) for _ in range(count)],
+        'large': [rng.uniform(-1e6, 1e6) for _ in range(count)],
+    }
+    new = Calculator()
+    old = RadianCalculator()
+
+    print("ns/value              old scalar  new scalar   new batch")
+    for name, values in inputs.items():
+        for operation in ('sin', 'cos', 'tan'):
+            timings = (
+                best(lambda: [old.scientific_operations(v, operation) for v in values]),
+                best(lambda: [new.scientific_operations(v, operation) for v in values]),
+                best(lambda: new.scientific_batch(values, operation)),
+            )
+            print(f"{name:<8} {operation:<12} " + "  ".join(f"{1e9 * t / count:>10.0f}" for t in timings))
+
+
+if __name__ == '__main__':
+    main()
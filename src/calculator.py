@@ -1,17 +1,72 @@
 import math
+from itertools import repeat
 from typing import Union, List, Optional
 from enum import Enum
 
+try:
+    from .result_cache import ResultCache
+    from .streaming_stats import DataSource, STATISTICS_OPERATIONS, compute_statistics
+except ImportError:  # src/ itself is on sys.path
+    from result_cache import ResultCache
+    from streaming_stats import DataSource, STATISTICS_OPERATIONS, compute_statistics
+
+_DEGREE = math.pi / 180
+
+
+def _exact_trig_tables():
+    """Exact sin/cos/tan for every multiple of 30 and 45 in (-360, 360) degrees"""
+    sqrt3 = math.sqrt(3)
+    first_quadrant_sin = {0: 0.0, 30: 0.5, 45: math.sqrt(0.5), 60: sqrt3 / 2, 90: 1.0}
+    first_quadrant_tan = {0: 0.0, 30: 1 / sqrt3, 45: 1.0, 60: sqrt3}
+    
+    def sin_at(angle):
+        angle %= 360
+        if angle <= 90:
+            return first_quadrant_sin[angle]
+        if angle <= 180:
+            return first_quadrant_sin[180 - angle]
+        if angle <= 270:
+            return -first_quadrant_sin[angle - 180]
+        return -first_quadrant_sin[360 - angle]
+    
+    def tan_at(angle):
+        if angle % 180 == 90:
+            return math.copysign(float('inf'), sin_at(angle))
+        angle %= 180
+        return first_quadrant_tan[angle] if angle < 90 else -first_quadrant_tan[180 - angle]
+    
+    angles = {k * 30 for k in range(-11, 12)} | {k * 45 for k in range(-7, 8)}
+    sin_table = {float(a): sin_at(a) + 0.0 for a in angles}
+    cos_table = {float(a): sin_at(a + 90) + 0.0 for a in angles}
+    tan_table = {float(a): tan_at(a) + 0.0 for a in angles}
+    return sin_table, cos_table, tan_table
+
+
+_SIN_EXACT, _COS_EXACT, _TAN_EXACT = _exact_trig_tables()
+
+# Trig operations take degrees. Reducing with fmod (or % for ints) is
+# exact, so large inputs keep their precision, and the tables catch the
+# special angles where converting to radians would leave noise such as
+# sin(180) = 1.2e-16.
+_TRIG_OPERATIONS = {
+    'sin': (math.sin, _SIN_EXACT),
+    'cos': (math.cos, _COS_EXACT),
+    'tan': (math.tan, _TAN_EXACT)
+}
+
+
 class CalculatorMode(Enum):
     BASIC = "basic"
     SCIENTIFIC = "scientific"
     PROGRAMMER = "programmer"
+    STATISTICS = "statistics"
 
 class Calculator:
-    def __init__(self):
+    def __init__(self, cache: Optional[ResultCache] = None):
         self.memory: float = 0.0
         self.mode: CalculatorMode = CalculatorMode.BASIC
         self.last_result: Optional[float] = None
+        self.cache = cache
     
     def basic_operations(self, a: float, b: float, operation: str) -> float:
         """Perform basic arithmetic operations"""
@@ -32,29 +87,73 @@ class Calculator:
         return result
     
     def scientific_operations(self, value: float, operation: str) -> float:
-        """Perform scientific operations"""
-        if operation == 'sin':
-            result = math.sin(math.radians(value))
-        elif operation == 'cos':
-            result = math.cos(math.radians(value))
-        elif operation == 'tan':
-            result = math.tan(math.radians(value))
+        """Perform scientific operations
+
+        Only factorial results go through the result cache; the other
+        operations cost less to compute than a cache lookup.
+        """
+        trig = _TRIG_OPERATIONS.get(operation)
+        if trig is not None:
+            function, exact = trig
+            if isinstance(value, int):
+                # fmod would round a huge int to float first; int % is exact
+                if value >= 360 or value <= -360:
+                    value = value % 360 if value > 0 else -(-value % 360)
+                whole = True
+            else:
+                if value >= 360.0 or value <= -360.0:
+                    value = math.fmod(value, 360.0)
+                # Only whole degrees can be special angles, so other values
+                # skip the (slow) float hash of the table lookup
+                whole = value.is_integer()
+            if whole and value in exact:
+                result = exact[value]
+            else:
+                result = function(value * _DEGREE)
         elif operation == 'log':
             result = math.log10(value) if value > 0 else float('nan')
         elif operation == 'ln':
             result = math.log(value) if value > 0 else float('nan')
         elif operation == 'sqrt':
             result = math.sqrt(value) if value >= 0 else float('nan')
-        elif operation == 'factorial':
-            result = math.factorial(int(value)) if value >= 0 and value.is_integer() else float('nan')
         elif operation == 'exp':
             result = math.exp(value)
+        elif operation == 'factorial':
+            if self.cache is not None:
+                key = ResultCache.operation_key(operation, value)
+                result = self.cache.get(key)
+                if result is not None:
+                    self.last_result = result
+                    return result
+            result = math.factorial(int(value)) if value >= 0 and value.is_integer() else float('nan')
+            if self.cache is not None:
+                self.cache.put(key, result)
         else:
             raise ValueError(f"Unsupported scientific operation: {operation}")
         
         self.last_result = result
         return result
     
+    def scientific_batch(self, values: List[float], operation: str) -> List[float]:
+        """Perform a scientific operation on each value"""
+        trig = _TRIG_OPERATIONS.get(operation)
+        # fmod is only exact for floats, so lists holding ints (which may
+        # be too large for a float) take the scalar path
+        if trig is not None and set(map(type, values)) == {float}:
+            # Same reduction and table as scientific_operations, inlined in
+            # one comprehension to avoid a method call per value
+            function, exact = trig
+            results = [
+                exact[angle] if angle.is_integer() and angle in exact else function(angle * _DEGREE)
+                for angle in map(math.fmod, values, repeat(360.0))
+            ]
+        else:
+            results = [self.scientific_operations(value, operation) for value in values]
+        
+        if results:
+            self.last_result = results[-1]
+        return results
+    
     def programmer_operations(self, value: int, operation: str) -> Union[int, str]:
         """Perform programmer operations"""
         if not isinstance(value, int):
@@ -82,6 +181,16 @@ class Calculator:
         self.last_result = result if isinstance(result, int) else float('nan')
         return result
     
+    def statistics_operations(self, data: DataSource, operation: str,
+                              chunk_size: int = 65536, processes: Optional[int] = 1) -> float:
+        """Perform statistics operations over an iterable or a file of numbers"""
+        if operation not in STATISTICS_OPERATIONS:
+            raise ValueError(f"Unsupported statistics operation: {operation}")
+        
+        result = compute_statistics(data, chunk_size, processes).result(operation)
+        self.last_result = result
+        return result
+    
     def memory_operations(self, operation: str, value: float = None) -> float:
         """Perform memory operations"""
         if operation == 'store':
@@ -105,16 +214,32 @@ class Calculator:
     
     def evaluate_expression(self, expression: str) -> float:
         """Evaluate simple mathematical expressions"""
+        allowed_chars = set('0123456789+-*/.() ')
+        valid = all(c in allowed_chars for c in expression)
+        
+        key = None
+        if self.cache is not None and valid:
+            try:
+                key = ResultCache.expression_key(expression)
+            except (SyntaxError, ValueError):
+                pass  # Not cacheable; eval below reports the error
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.last_result = cached
+                return cached
+        
         try:
-            allowed_chars = set('0123456789+-*/.() ')
-            if not all(c in allowed_chars for c in expression):
+            if not valid:
                 raise ValueError("Expression contains invalid characters")
-            
-            result = eval(expression)
-            self.last_result = float(result)
-            return self.last_result
+            result = float(eval(expression))
         except Exception as e:
             raise ValueError(f"Invalid expression: {e}")
+        
+        if key is not None:
+            self.cache.put(key, result)
+        self.last_result = result
+        return result
     
     def get_last_result(self) -> Optional[float]:
         """Get the last calculation result"""
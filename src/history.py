@@ -1,66 +1,367 @@
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from datetime import datetime, timezone
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
 import json
+import sys
+import time
+
+try:
+    from .quantiles import KLLSketch
+except ImportError:  # src/ itself is on sys.path
+    from quantiles import KLLSketch
+
+_time_key = attrgetter('timestamp')
+
+# New results are buffered and fed to the quantile sketches in batches
+# of at most this many (or max_entries, if smaller)
+_SKETCH_BATCH = 1024
+
+# Per-operation sketches trade some accuracy (rank error about 1.7/k) for
+# memory, since a History keeps one per distinct operation
+_OPERATION_SKETCH_K = 64
+
+
+def parse_datetime(value: Any) -> datetime:
+    """Parse an ISO 8601 string or epoch number into a UTC datetime"""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc)
+    # Strings without an offset are local time, as older exports wrote them
+    return datetime.fromisoformat(value).astimezone(timezone.utc)
+
+
+def parse_timestamp(value: Any) -> float:
+    """Parse an ISO 8601 string or epoch number into an epoch timestamp"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return parse_datetime(value).timestamp()
+
+
+def write_history_lines(filename: str, entries: Iterable[Dict[str, Any]]) -> int:
+    """Write entry dicts as JSON Lines, the streaming export format"""
+    count = 0
+    with open(filename, 'w') as f:
+        for entry in entries:
+            f.write(json.dumps(entry))
+            f.write('\n')
+            count += 1
+    return count
+
+
+def iter_history(filename: str, chunk_size: int = 65536) -> Iterator[Dict[str, Any]]:
+    """Stream entry dicts from an exported history file without loading it whole
+
+    Accepts both the JSON array written by export_history and the JSON
+    Lines streaming format.
+    """
+    decoder = json.JSONDecoder()
+    with open(filename, 'r') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+        started = False
+        while True:
+            while pos < len(buffer) and (buffer[pos].isspace() or (started and buffer[pos] == ',')):
+                pos += 1
+            if pos == len(buffer):
+                if eof:
+                    break
+                buffer = f.read(chunk_size)
+                pos = 0
+                eof = not buffer
+                continue
+            if not started:
+                if buffer[pos] == '{':
+                    f.seek(0)
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+                    return
+                if buffer[pos] != '[':
+                    raise ValueError(f"Not a history export: {filename}")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                return
+            try:
+                entry, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # Entry straddles the chunk boundary; read more and retry
+                more = f.read(chunk_size)
+                eof = not more
+                buffer = buffer[pos:] + more
+                pos = 0
+                continue
+            yield entry
+    if started:
+        raise ValueError(f"Truncated history export: {filename}")
+
+
+class HistoryEntry:
+    """Compact history record with a dict-style view for existing callers"""
+    
+    __slots__ = ('timestamp', 'operation', 'operands', 'result', 'mode')
+    _fields = __slots__
+    
+    def __init__(self, timestamp: float, operation: str, operands, result: Any, mode: str = "basic"):
+        # Epoch seconds; the ISO string is only built by the dict view
+        self.timestamp = timestamp
+        self.operation = sys.intern(operation)
+        self.operands = tuple(operands)
+        self.result = result
+        self.mode = sys.intern(mode)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HistoryEntry':
+        """Build an entry from an exported dict"""
+        return cls(
+            parse_timestamp(data['timestamp']),
+            data['operation'],
+            data['operands'],
+            data['result'],
+            data.get('mode', 'basic')
+        )
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the entry as a plain dict"""
+        return {key: self[key] for key in self._fields}
+    
+    def keys(self):
+        """Get the dict-view keys"""
+        return self._fields
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a dict-view value with a default"""
+        return self[key] if key in self._fields else default
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        if key == 'timestamp':
+            # ISO formatting is the costly part, so it only happens on access
+            return datetime.fromtimestamp(self.timestamp, timezone.utc).isoformat()
+        if key == 'operands':
+            return list(self.operands)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value: Any):
+        if key not in self._fields:
+            raise KeyError(key)
+        if key == 'timestamp':
+            self.timestamp = parse_timestamp(value)
+            return
+        if key == 'operands':
+            value = tuple(value)
+        elif key in ('operation', 'mode'):
+            value = sys.intern(value)
+        setattr(self, key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._fields
+    
+    def __iter__(self):
+        return iter(self._fields)
+    
+    def __len__(self) -> int:
+        return len(self._fields)
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, HistoryEntry):
+            other = other.as_dict()
+        return self.as_dict() == other
+    
+    def __repr__(self) -> str:
+        return f"HistoryEntry({self.as_dict()!r})"
+
 
 class History:
-    def __init__(self, max_entries: int = 100):
-        self.history: List[Dict[str, Any]] = []
+    def __init__(self, max_entries: int = 100, lazy_statistics: bool = False):
+        self.history: List[HistoryEntry] = []
         self.max_entries = max_entries
+        # With lazy_statistics the quantile sketches are only created on
+        # the first statistics request, seeded from the retained entries,
+        # so histories that never report statistics stay small
+        self.lazy_statistics = lazy_statistics
+        self._last_time: Optional[float] = None
+        self._sketch_batch = max(1, min(_SKETCH_BATCH, max_entries))
+        self._reset_sketches()
+    
+    def _next_time(self) -> float:
+        """Return the current epoch time, never earlier than the previous entry"""
+        # Wall clock adjustments can move the clock backwards; clamping
+        # keeps the buffer time-ordered so range queries can bisect it.
+        now = time.time()
+        if self._last_time is not None and now < self._last_time:
+            now = self._last_time
+        self._last_time = now
+        return now
     
     def add_entry(self, operation: str, operands: List, result: float, mode: str = "basic"):
         """Add a calculation to history"""
-        entry = {
-            'timestamp': datetime.now().isoformat(),
-            'operation': operation,
-            'operands': operands,
-            'result': result,
-            'mode': mode
-        }
-        
+        entry = HistoryEntry(self._next_time(), operation, operands, result, mode)
         self.history.append(entry)
+        if self.result_sketch is not None and isinstance(result, (int, float)):
+            self._buffer_result(entry.operation, result)
         
         if len(self.history) > self.max_entries:
             self.history.pop(0)
     
-    def get_recent_entries(self, count: int = 5) -> List[Dict[str, Any]]:
+    def _buffer_result(self, operation: str, result: float):
+        """Queue a numeric result for the sketches, flushing a full batch"""
+        pending = self._unsketched.get(operation)
+        if pending is None:
+            pending = self._unsketched[operation] = []
+        pending.append(result)
+        self._unsketched_count += 1
+        if self._unsketched_count >= self._sketch_batch:
+            self._flush_sketches()
+    
+    def _buffer_entries(self, entries: Iterable[HistoryEntry]):
+        """Queue the numeric results of existing entries for the sketches"""
+        for entry in entries:
+            if isinstance(entry.result, (int, float)):
+                self._unsketched.setdefault(entry.operation, []).append(entry.result)
+                self._unsketched_count += 1
+    
+    def _start_sketches(self):
+        """Create a lazy history's sketches from its retained entries"""
+        if self.result_sketch is None:
+            self.result_sketch = KLLSketch()
+            self._buffer_entries(self.history)
+    
+    def _flush_sketches(self):
+        """Feed buffered numeric results into the quantile sketches"""
+        if not self._unsketched_count:
+            return
+        by_operation = self._unsketched
+        self._unsketched = {}
+        self._unsketched_count = 0
+        
+        for operation, results in by_operation.items():
+            self.result_sketch.update(results)
+            sketch = self.operation_sketches.get(operation)
+            if sketch is None:
+                sketch = self.operation_sketches[operation] = KLLSketch(k=_OPERATION_SKETCH_K)
+            sketch.update(results)
+    
+    def _reset_sketches(self):
+        """Drop all quantile sketch state"""
+        self.result_sketch: Optional[KLLSketch] = None if self.lazy_statistics else KLLSketch()
+        self.operation_sketches: Dict[str, KLLSketch] = {}
+        # Numeric results not yet in the sketches, grouped by operation;
+        # only the floats are kept so evicted entries can be freed
+        self._unsketched: Dict[str, List[float]] = {}
+        self._unsketched_count = 0
+    
+    def merge_statistics(self, other: 'History'):
+        """Merge another history's quantile sketches into this one"""
+        self._start_sketches()
+        other._start_sketches()
+        self._flush_sketches()
+        other._flush_sketches()
+        self.result_sketch.merge(other.result_sketch)
+        for operation, sketch in other.operation_sketches.items():
+            if operation not in self.operation_sketches:
+                self.operation_sketches[operation] = KLLSketch(k=_OPERATION_SKETCH_K)
+            self.operation_sketches[operation].merge(sketch)
+    
+    def get_recent_entries(self, count: int = 5) -> List[HistoryEntry]:
         """Get recent calculation entries"""
         return self.history[-count:] if count <= len(self.history) else self.history
     
-    def search_operations(self, operation: str) -> List[Dict[str, Any]]:
+    def entries_between(self, start: Optional[float] = None, end: Optional[float] = None) -> List[HistoryEntry]:
+        """Get entries with start <= timestamp <= end (epoch seconds)"""
+        lo = 0
+        hi = len(self.history)
+        if start is not None:
+            lo = bisect_left(self.history, start, key=_time_key)
+        if end is not None:
+            hi = bisect_right(self.history, end, key=_time_key)
+        return self.history[lo:hi]
+    
+    def search_operations(self, operation: str) -> List[HistoryEntry]:
         """Search history by operation type"""
-        return [entry for entry in self.history if operation in entry['operation']]
+        return [entry for entry in self.history if operation in entry.operation]
     
     def clear_history(self):
         """Clear all history"""
         self.history.clear()
+        self._reset_sketches()
     
     def get_statistics(self) -> Dict[str, Any]:
-        """Get calculation statistics"""
-        if not self.history:
-            return {}
-        
-        results = [entry['result'] for entry in self.history if isinstance(entry['result'], (int, float))]
+        """Get calculation statistics
+
+        The top-level figures cover the retained entries. The
+        streaming_statistics section comes from the quantile sketches
+        and covers every result added since the last clear or import,
+        plus any merged histories, including entries already dropped by
+        max_entries; its quantiles are approximate.
+        """
+        statistics: Dict[str, Any] = {}
+        results = [entry.result for entry in self.history if isinstance(entry.result, (int, float))]
         
-        if not results:
-            return {}
+        if results:
+            statistics = {
+                'total_calculations': len(self.history),
+                'average_result': sum(results) / len(results),
+                'min_result': min(results),
+                'max_result': max(results),
+                'most_used_operation': max(
+                    set(entry.operation for entry in self.history),
+                    key=list(entry.operation for entry in self.history).count
+                )
+            }
         
+        # Merged sketches may hold results even when no entries are retained
+        self._start_sketches()
+        self._flush_sketches()
+        if self.result_sketch.count:
+            operations = {
+                operation: self._sketch_statistics(sketch)
+                for operation, sketch in self.operation_sketches.items()
+            }
+            statistics['streaming_statistics'] = dict(self._sketch_statistics(self.result_sketch),
+                                                      operations=operations)
+        return statistics
+    
+    @staticmethod
+    def _sketch_statistics(sketch: KLLSketch) -> Dict[str, Any]:
+        """Summarise one quantile sketch"""
+        median, p95, p99 = sketch.quantiles([0.5, 0.95, 0.99])
         return {
-            'total_calculations': len(self.history),
-            'average_result': sum(results) / len(results),
-            'min_result': min(results),
-            'max_result': max(results),
-            'most_used_operation': max(
-                set(entry['operation'] for entry in self.history),
-                key=list(entry['operation'] for entry in self.history).count
-            )
+            'count': sketch.count,
+            'min_result': sketch.min,
+            'max_result': sketch.max,
+            'median_result': median,
+            'p95_result': p95,
+            'p99_result': p99
         }
     
-    def export_history(self, filename: str):
-        """Export history to JSON file"""
+    def export_history(self, filename: str, streaming: bool = False):
+        """Export history to JSON file, or to JSON Lines when streaming"""
+        exported = (entry.as_dict() for entry in self.history)
+        if streaming:
+            write_history_lines(filename, exported)
+            return
         with open(filename, 'w') as f:
-            json.dump(self.history, f, indent=2)
+            json.dump(list(exported), f, indent=2)
     
     def import_history(self, filename: str):
-        """Import history from JSON file"""
-        with open(filename, 'r') as f:
-            self.history = json.load(f)
\ No newline at end of file
+        """Import history from a JSON or JSON Lines file"""
+        self.restore_entries(HistoryEntry.from_dict(data) for data in iter_history(filename))
+    
+    def restore_entries(self, entries: Iterable[HistoryEntry]):
+        """Replace the history with the given entries, rebuilding statistics"""
+        entries = list(entries)
+        
+        # Keep the buffer time-ordered for entries_between
+        entries.sort(key=_time_key)
+        
+        self.history = entries
+        self._reset_sketches()
+        if self.result_sketch is not None:
+            self._buffer_entries(entries)
+        self._last_time = entries[-1].timestamp if entries else None
\ No newline at end of file
@@ -0,0 +1,76 @@
+import argparse
+import heapq
+import json
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    from .history import iter_history, parse_timestamp, write_history_lines
+except ImportError:  # src/ itself is on sys.path
+    from history import iter_history, parse_timestamp, write_history_lines
+
+
+def _timestamp_key(entry: Dict[str, Any]) -> float:
+    """Sort key for exported entries, whose timestamps are ISO strings"""
+    return parse_timestamp(entry['timestamp'])
+
+
+def _deduplicate(entries: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Drop repeated entries; duplicates share an instant so only one bucket is kept
+
+    Timestamps are compared as instants, so the same moment written with
+    different UTC offsets still counts as a duplicate.
+    """
+    current_timestamp = None
+    seen = set()
+    for entry in entries:
+        timestamp = _timestamp_key(entry)
+        if timestamp != current_timestamp:
+            current_timestamp = timestamp
+            seen.clear()
+        key = json.dumps({**entry, 'timestamp': timestamp}, sort_keys=True)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield entry
+
+
+def merge_histories(filenames: List[str], deduplicate: bool = False) -> Iterator[Dict[str, Any]]:
+    """K-way merge time-ordered history files by timestamp
+
+    Each input is streamed with iter_history and only its current head
+    entry is held in the heap, so memory is constant per input.
+    """
+    merged = heapq.merge(*(iter_history(filename) for filename in filenames), key=_timestamp_key)
+    return _deduplicate(merged) if deduplicate else merged
+
+
+def merge_history_files(filenames: List[str], output: str, max_entries: Optional[int] = None,
+                        deduplicate: bool = False) -> int:
+    """Merge history files into a JSON Lines file, returning the entry count
+
+    With max_entries only the most recent entries are written, like the
+    History buffer itself.
+    """
+    entries = merge_histories(filenames, deduplicate)
+    if max_entries is not None:
+        entries = deque(entries, maxlen=max_entries)
+    return write_history_lines(output, entries)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: python src/history_merge.py OUTPUT INPUT..."""
+    parser = argparse.ArgumentParser(description="Merge exported History files by timestamp")
+    parser.add_argument('output', help="JSON Lines file to write")
+    parser.add_argument('inputs', nargs='+', help="history exports to merge")
+    parser.add_argument('--max-entries', type=int, default=None, help="keep only the most recent entries")
+    parser.add_argument('--deduplicate', action='store_true', help="drop identical entries")
+    args = parser.parse_args(argv)
+    
+    count = merge_history_files(args.inputs, args.output, args.max_entries, args.deduplicate)
+    print(f"Wrote {count} entries to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
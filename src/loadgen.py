@@ -0,0 +1,213 @@
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .calculator import Calculator
+    from .history import History
+except ImportError:  # src/ itself is on sys.path
+    from calculator import Calculator
+    from history import History
+
+DEFAULT_MIX = {
+    'basic': 30,
+    'scientific': 20,
+    'programmer': 10,
+    'expression': 10,
+    'memory': 10,
+    'history_write': 15,
+    'stats_poll': 5
+}
+
+BASIC_OPERATIONS = ['+', '-', '*', '/', '^', '%']
+TRIG_OPERATIONS = ['sin', 'cos', 'tan']
+SCIENTIFIC_OPERATIONS = ['log', 'ln', 'sqrt', 'exp', 'factorial']
+PROGRAMMER_OPERATIONS = ['bin', 'hex', 'oct', 'and', 'or', 'xor', 'shift_left', 'shift_right']
+MEMORY_OPERATIONS = ['store', 'recall', 'add', 'subtract', 'clear']
+
+Call = Tuple[str, tuple]
+
+
+def _make_call(kind: str, rng: random.Random) -> Call:
+    """Build the arguments for one call of the given kind"""
+    if kind == 'basic':
+        operation = rng.choice(BASIC_OPERATIONS)
+        if operation == '^':
+            return kind, (float(rng.randint(0, 20)), float(rng.randint(0, 5)), operation)
+        # basic_operations evaluates every operator eagerly, so operands
+        # must stay small enough for a ** b not to overflow
+        return kind, (rng.uniform(-100, 100), rng.uniform(-100, 100), operation)
+    elif kind == 'scientific':
+        if rng.random() < 0.5:
+            return kind, (rng.choice([rng.uniform(-720, 720), float(rng.randrange(-720, 720, 15))]),
+                          rng.choice(TRIG_OPERATIONS))
+        operation = rng.choice(SCIENTIFIC_OPERATIONS)
+        if operation == 'factorial':
+            return kind, (float(rng.randint(0, 20)), operation)
+        return kind, (rng.uniform(0.001, 50), operation)
+    elif kind == 'programmer':
+        return kind, (rng.randint(0, 0xFFFF), rng.choice(PROGRAMMER_OPERATIONS))
+    elif kind == 'expression':
+        a, b, c, d = (rng.randint(1, 999) for _ in range(4))
+        return kind, (f"{a} + {b} * ({c} - {d}) / {rng.randint(1, 9)}",)
+    elif kind == 'memory':
+        return kind, (rng.choice(MEMORY_OPERATIONS), rng.uniform(-100, 100))
+    elif kind == 'history_write':
+        a, b = rng.uniform(0, 100), rng.uniform(0, 100)
+        return kind, (rng.choice(['+', '-', '*']), [a, b], a + b, 'basic')
+    elif kind == 'stats_poll':
+        return kind, ()
+    raise ValueError(f"Unsupported workload kind: {kind}")
+
+
+def generate_workload(count: int, mix: Optional[Dict[str, float]] = None, seed: Optional[int] = None) -> List[Call]:
+    """Build a list of calls drawn from a weighted mix; the same seed gives the same list"""
+    mix = mix or DEFAULT_MIX
+    rng = random.Random(seed)
+    kinds = rng.choices(list(mix), weights=list(mix.values()), k=count)
+    return [_make_call(kind, rng) for kind in kinds]
+
+
+def _execute(calculator: Calculator, history: History, kind: str, args: tuple) -> Any:
+    """Dispatch one generated call to the Calculator or History API"""
+    if kind == 'basic':
+        return calculator.basic_operations(*args)
+    elif kind == 'scientific':
+        return calculator.scientific_operations(*args)
+    elif kind == 'programmer':
+        return calculator.programmer_operations(*args)
+    elif kind == 'expression':
+        return calculator.evaluate_expression(*args)
+    elif kind == 'memory':
+        return calculator.memory_operations(*args)
+    elif kind == 'history_write':
+        return history.add_entry(*args)
+    elif kind == 'stats_poll':
+        return history.get_statistics()
+    raise ValueError(f"Unsupported workload kind: {kind}")
+
+
+def _run_worker(calls: List[Call], rate: Optional[float], history_size: int) -> Dict[str, Any]:
+    """Run calls in order, returning per-kind latencies in nanoseconds"""
+    calculator = Calculator()
+    history = History(max_entries=history_size)
+    latencies: Dict[str, List[int]] = {}
+    errors: Dict[str, int] = {}
+    interval = 1e9 / rate if rate else 0.0
+    start = time.perf_counter_ns()
+    
+    for i, (kind, args) in enumerate(calls):
+        if interval:
+            # Open-loop pacing: latency is measured from the scheduled
+            # start, so a slow call also charges the calls queued behind it
+            scheduled = start + int(i * interval)
+            delay = scheduled - time.perf_counter_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+        else:
+            scheduled = time.perf_counter_ns()
+        try:
+            _execute(calculator, history, kind, args)
+        except (ValueError, ArithmeticError):
+            errors[kind] = errors.get(kind, 0) + 1
+        latencies.setdefault(kind, []).append(time.perf_counter_ns() - scheduled)
+    
+    return {'latencies': latencies, 'errors': errors, 'elapsed_ns': time.perf_counter_ns() - start}
+
+
+def _percentile(sorted_values: List[int], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_values) - 1, int(q * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def run_load(requests: int, workers: int = 4, rate: Optional[float] = None,
+             mix: Optional[Dict[str, float]] = None, seed: Optional[int] = None,
+             processes: bool = False, history_size: int = 100) -> Dict[str, Any]:
+    """Drive Calculator and History from several workers and report latencies
+
+    requests calls are split evenly across workers, each with its own
+    Calculator and History. rate is the target total calls per second
+    (None runs flat out). Worker i uses seed + i, so a seeded run
+    replays exactly the same calls. Latency percentiles are in
+    milliseconds.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    per_worker = [requests // workers + (1 if i < requests % workers else 0) for i in range(workers)]
+    workloads = [
+        generate_workload(count, mix, None if seed is None else seed + i)
+        for i, count in enumerate(per_worker)
+    ]
+    worker_rate = rate / workers if rate else None
+    
+    executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    start = time.perf_counter()
+    with executor_class(max_workers=workers) as executor:
+        results = list(executor.map(
+            _run_worker, workloads, [worker_rate] * workers, [history_size] * workers
+        ))
+    elapsed = time.perf_counter() - start
+    
+    latencies: Dict[str, List[int]] = {}
+    errors: Dict[str, int] = {}
+    for result in results:
+        for kind, values in result['latencies'].items():
+            latencies.setdefault(kind, []).extend(values)
+        for kind, count in result['errors'].items():
+            errors[kind] = errors.get(kind, 0) + count
+    
+    operations = {}
+    for kind, values in sorted(latencies.items()):
+        values.sort()
+        operations[kind] = {
+            'count': len(values),
+            'errors': errors.get(kind, 0),
+            'p50_ms': _percentile(values, 0.50) / 1e6,
+            'p99_ms': _percentile(values, 0.99) / 1e6,
+            'p999_ms': _percentile(values, 0.999) / 1e6,
+            'max_ms': values[-1] / 1e6
+        }
+    
+    total = sum(per_worker)
+    return {
+        'total_requests': total,
+        'elapsed_seconds': elapsed,
+        'throughput': total / elapsed if elapsed > 0 else 0.0,
+        'operations': operations
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: python src/loadgen.py --requests N --workers N"""
+    parser = argparse.ArgumentParser(description="Generate load against Calculator and History")
+    parser.add_argument('--requests', type=int, default=100000, help="total calls to make")
+    parser.add_argument('--workers', type=int, default=4, help="number of worker threads or processes")
+    parser.add_argument('--rate', type=float, default=None, help="target calls per second across all workers")
+    parser.add_argument('--seed', type=int, default=None, help="seed for a reproducible workload")
+    parser.add_argument('--processes', action='store_true', help="use processes instead of threads")
+    parser.add_argument('--mix', default=None,
+                        help="comma separated kind=weight pairs, e.g. basic=5,scientific=1")
+    args = parser.parse_args(argv)
+    
+    mix = None
+    if args.mix:
+        mix = {}
+        for pair in args.mix.split(','):
+            kind, weight = pair.split('=')
+            mix[kind.strip()] = float(weight)
+    
+    report = run_load(args.requests, args.workers, args.rate, mix, args.seed, args.processes)
+    print(f"{report['total_requests']} requests in {report['elapsed_seconds']:.2f}s "
+          f"({report['throughput']:,.0f} req/s)")
+    print(f"{'operation':<14} {'count':>8} {'errors':>7} {'p50 ms':>9} {'p99 ms':>9} {'p999 ms':>9}")
+    for kind, stats in report['operations'].items():
+        print(f"{kind:<14} {stats['count']:>8} {stats['errors']:>7} {stats['p50_ms']:>9.4f} "
+              f"{stats['p99_ms']:>9.4f} {stats['p999_ms']:>9.4f}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,153 @@
+import math
+import random
+from array import array
+from typing import Iterable, List, Optional
+
+
+def _to_double(value: float) -> float:
+    """Convert to float, keeping ints beyond the double range as +/-inf"""
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+
+
+class KLLSketch:
+    """Mergeable streaming quantile sketch (Karnin, Lang and Liberty).
+
+    Memory is O(k) and the rank error of a quantile is roughly 1.7/k
+    with high probability, independent of how many values are added.
+    Levels are stored as arrays of doubles, 8 bytes per retained value.
+    """
+    
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.compactors: List[array] = [array('d')]
+        self._size = 0
+        self._max_size = 0
+        self._capacities: List[int] = []
+        # A private generator costs ~2.5KB, so only seeded sketches get one
+        self._rng = random.Random(seed) if seed is not None else random
+        self._update_max_size()
+    
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+    
+    def _update_max_size(self):
+        # Capacities only change when a level is added, so they are cached
+        self._capacities = [self._capacity(level) for level in range(len(self.compactors))]
+        self._max_size = sum(self._capacities)
+    
+    def _compress(self):
+        """Halve the first full level, promoting survivors one level up"""
+        for level, items in enumerate(self.compactors):
+            if len(items) >= self._capacities[level]:
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(array('d'))
+                    self._update_max_size()
+                items = sorted(items)
+                kept = array('d', [items.pop()] if len(items) % 2 else [])
+                promoted = items[self._rng.randint(0, 1)::2]
+                self.compactors[level + 1].extend(promoted)
+                self.compactors[level] = kept
+                self._size -= len(items) - len(promoted)
+                return
+    
+    def add(self, value: float):
+        """Add a value to the sketch; NaN is ignored"""
+        if value != value:
+            return
+        value = _to_double(value)
+        self.compactors[0].append(value)
+        self.count += 1
+        self._size += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self._size >= self._max_size:
+            self._compress()
+    
+    def update(self, values: Iterable[float]):
+        """Add every value from an iterable in one batch; NaN is ignored"""
+        try:
+            values = array('d', values)
+        except OverflowError:
+            values = array('d', map(_to_double, values))
+        total = sum(values)
+        if total != total:
+            # NaN somewhere (or inf - inf); only then filter value by value
+            values = array('d', [value for value in values if value == value])
+        if not values:
+            return
+        self.compactors[0].extend(values)
+        self.count += len(values)
+        self._size += len(values)
+        low, high = min(values), max(values)
+        if self.min is None or low < self.min:
+            self.min = low
+        if self.max is None or high > self.max:
+            self.max = high
+        while self._size >= self._max_size:
+            self._compress()
+    
+    def merge(self, other: 'KLLSketch'):
+        """Merge another sketch into this one"""
+        if other.count == 0:
+            return
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(array('d'))
+        self._update_max_size()
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.count += other.count
+        self._size = sum(len(items) for items in self.compactors)
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        while self._size >= self._max_size:
+            self._compress()
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Get the approximate value at quantile q (0 <= q <= 1)"""
+        return self.quantiles([q])[0]
+    
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """Get approximate values for several quantiles in one pass"""
+        qs = list(qs)
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError("Quantiles must be between 0 and 1")
+        if self.count == 0:
+            return [None for _ in qs]
+        
+        weighted = sorted(
+            (value, 1 << level)
+            for level, items in enumerate(self.compactors)
+            for value in items
+        )
+        total = sum(weight for _, weight in weighted)
+        
+        results = []
+        for q in qs:
+            if q == 0:
+                results.append(self.min)
+                continue
+            if q == 1:
+                results.append(self.max)
+                continue
+            target = q * total
+            cumulative = 0
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    break
+            results.append(value)
+        return results
+    
+    def __len__(self) -> int:
+        return self.count
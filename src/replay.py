@@ -0,0 +1,173 @@
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .calculator import Calculator
+    from .history import iter_history
+    from .streaming_stats import split_ranges
+except ImportError:  # src/ itself is on sys.path
+    from calculator import Calculator
+    from history import iter_history
+    from streaming_stats import split_ranges
+
+
+def replay_entry(calculator: Calculator, entry: Dict[str, Any]) -> Any:
+    """Recompute a history entry with the operation its mode refers to"""
+    mode = entry.get('mode', 'basic')
+    operation = entry['operation']
+    operands = entry['operands']
+    
+    if mode == 'basic':
+        return calculator.basic_operations(operands[0], operands[1], operation)
+    elif mode == 'scientific':
+        return calculator.scientific_operations(operands[0], operation)
+    elif mode == 'programmer':
+        return calculator.programmer_operations(operands[0], operation)
+    else:
+        raise ValueError(f"Unsupported replay mode: {mode}")
+
+
+def results_match(expected: Any, actual: Any, rel_tol: float = 1e-9, abs_tol: float = 1e-12) -> bool:
+    """Compare a recorded result with a recomputed one, tolerating float noise"""
+    if isinstance(expected, bool) or isinstance(actual, bool):
+        return expected == actual
+    if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+        if isinstance(expected, int) and isinstance(actual, int):
+            return expected == actual
+        expected, actual = float(expected), float(actual)
+        if math.isnan(expected) or math.isnan(actual):
+            return math.isnan(expected) and math.isnan(actual)
+        return math.isclose(expected, actual, rel_tol=rel_tol, abs_tol=abs_tol)
+    return expected == actual
+
+
+# Separators that start a new entry in each layout the workers can split:
+# JSON Lines, and the indent=2 array written by History.export_history
+_LINE_SEPARATOR = b'\n'
+_ARRAY_SEPARATOR = b'\n  {'
+
+
+def _replay_entries(entries: Iterable[Dict[str, Any]], rel_tol: float, abs_tol: float) -> Tuple[int, List[Dict[str, Any]]]:
+    """Replay entries, returning the count and mismatches indexed from zero"""
+    calculator = Calculator()
+    mismatches = []
+    count = 0
+    for index, entry in enumerate(entries):
+        count += 1
+        try:
+            actual = replay_entry(calculator, entry)
+        except Exception as e:
+            mismatches.append({'index': index, 'entry': entry, 'actual': None, 'error': str(e)})
+            continue
+        if not results_match(entry.get('result'), actual, rel_tol, abs_tol):
+            mismatches.append({'index': index, 'entry': entry, 'actual': actual, 'error': None})
+    return count, mismatches
+
+
+def _decode_range(filename: str, start: int, end: int, layout: bytes) -> List[Dict[str, Any]]:
+    """Read and decode the entries stored in bytes [start, end) of an export"""
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    if layout == _LINE_SEPARATOR:
+        return [json.loads(line) for line in data.splitlines() if line.strip()]
+    body = data.strip().lstrip(b'[').rstrip(b']').strip().strip(b',')
+    return json.loads(b'[' + body + b']')
+
+
+def _replay_range(filename: str, start: int, end: int, layout: bytes,
+                  rel_tol: float, abs_tol: float) -> Tuple[int, List[Dict[str, Any]]]:
+    """Decode and replay one byte range of an export inside a worker"""
+    return _replay_entries(_decode_range(filename, start, end, layout), rel_tol, abs_tol)
+
+
+def _replay_chunk(chunk: List[Dict[str, Any]], rel_tol: float, abs_tol: float) -> Tuple[int, List[Dict[str, Any]]]:
+    """Replay entries already decoded by the parent"""
+    return _replay_entries(chunk, rel_tol, abs_tol)
+
+
+def _detect_layout(filename: str) -> Optional[bytes]:
+    """Return the entry separator of a splittable export, or None"""
+    with open(filename, 'rb') as f:
+        head = f.read(16).lstrip()
+    if head.startswith(b'{'):
+        return _LINE_SEPARATOR
+    if head.startswith(b'[') and head[1:].startswith(b'\n  {'):
+        return _ARRAY_SEPARATOR
+    return None
+
+
+def _chunks(entries: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group entries into lists of chunk_size"""
+    entries = iter(entries)
+    while True:
+        chunk = list(islice(entries, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def replay_history(filename: str, processes: Optional[int] = None, chunk_bytes: int = 1 << 20,
+                   rel_tol: float = 1e-9, abs_tol: float = 1e-12) -> Dict[str, Any]:
+    """Replay an exported history through Calculator and report mismatches
+
+    JSON Lines files and the indented arrays written by export_history are
+    split into byte ranges of about chunk_bytes on entry boundaries; each
+    worker reads and decodes its own range, so the parent only ships
+    offsets. Other layouts are decoded by the parent and sent in chunks.
+    At most two chunks per process (one per CPU by default) are in flight,
+    so memory stays bounded for large files.
+    """
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be at least 1")
+    processes = processes or os.cpu_count() or 1
+    start = time.perf_counter()
+    
+    layout = _detect_layout(filename)
+    if layout is None:
+        # Roughly chunk_bytes worth of entries per chunk
+        jobs = ((_replay_chunk, chunk, rel_tol, abs_tol)
+                for chunk in _chunks(iter_history(filename), max(1, chunk_bytes // 128)))
+    else:
+        jobs = ((_replay_range, filename, range_start, range_end, layout, rel_tol, abs_tol)
+                for range_start, range_end in split_ranges(filename, chunk_bytes, layout))
+    
+    # Results are keyed by job number so indices can be made global at the end
+    results: Dict[int, Tuple[int, List[Dict[str, Any]]]] = {}
+    if processes == 1:
+        for number, (function, *args) in enumerate(jobs):
+            results[number] = function(*args)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending = {}
+            for number, (function, *args) in enumerate(jobs):
+                pending[executor.submit(function, *args)] = number
+                if len(pending) >= 2 * processes:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[pending.pop(future)] = future.result()
+            for future, number in pending.items():
+                results[number] = future.result()
+    
+    total = 0
+    mismatches: List[Dict[str, Any]] = []
+    for number in range(len(results)):
+        count, job_mismatches = results[number]
+        for mismatch in job_mismatches:
+            mismatch['index'] += total
+        mismatches.extend(job_mismatches)
+        total += count
+    
+    elapsed = time.perf_counter() - start
+    return {
+        'total_entries': total,
+        'matched_entries': total - len(mismatches),
+        'mismatches': mismatches,
+        'elapsed_seconds': elapsed,
+        'entries_per_second': total / elapsed if elapsed > 0 else 0.0
+    }
@@ -0,0 +1,120 @@
+import ast
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Bump when the key or value encoding changes so stale files are discarded
+CACHE_FORMAT = 2
+
+
+class ResultCache:
+    """Persistent result cache stored in a local SQLite file
+
+    The file can be shared by many processes: WAL journaling lets readers
+    proceed while one process writes, and entries survive restarts so a
+    fresh process starts with a warm cache. Once more than max_entries
+    results are stored the oldest inserts are evicted. Opening the file
+    with a different version discards everything in it. One instance may
+    be shared by threads; its connection is used under a lock.
+
+    Calculator only caches results that cost more to compute than a
+    lookup: expressions and factorials. Trig, log, ln, sqrt and exp are
+    always computed directly.
+    """
+    
+    def __init__(self, path: str, max_entries: int = 10000, version: str = "1", timeout: float = 5.0):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = path
+        self.max_entries = max_entries
+        self.version = f"{CACHE_FORMAT}:{version}"
+        self.hits = 0
+        self.misses = 0
+        self.first_hit_latency: Optional[float] = None
+        self._opened_at = time.perf_counter()
+        self._lock = threading.Lock()
+        
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._check_version()
+    
+    def _check_version(self):
+        """Drop all results if the file was written under another version"""
+        row = self._conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        if row is not None and row[0] == self.version:
+            return
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM results")
+            self._conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)", (self.version,))
+    
+    @staticmethod
+    def expression_key(expression: str) -> str:
+        """Cache key for an expression, built from its parsed form
+
+        Spacing that does not change the parse shares a key, while spacing
+        that does (like "1 2") raises SyntaxError instead of colliding.
+        """
+        return "expr:" + ast.dump(ast.parse(expression.strip(), mode='eval'))
+    
+    @staticmethod
+    def operation_key(operation: str, value: float) -> str:
+        """Cache key for a single-operand operation"""
+        return f"op:{operation}:{float(value)!r}"
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached result, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self.first_hit_latency is None:
+                self.first_hit_latency = time.perf_counter() - self._opened_at
+        return json.loads(row[0])
+    
+    def put(self, key: str, value: Any):
+        """Store a result, evicting the oldest entries beyond max_entries"""
+        # Values are JSON so NaN and inf survive (SQLite REAL would turn
+        # NaN into NULL); results JSON cannot encode are simply not cached
+        try:
+            encoded = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)", (key, encoded))
+            self._conn.execute(
+                "DELETE FROM results WHERE rowid <= (SELECT MAX(rowid) FROM results) - ?",
+                (self.max_entries,)
+            )
+    
+    def clear(self):
+        """Remove all cached results"""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get hit/miss counts for this process"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'first_hit_latency': self.first_hit_latency
+        }
+    
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
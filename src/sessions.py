@@ -0,0 +1,165 @@
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+try:
+    from .calculator import Calculator, CalculatorMode
+    from .history import History, HistoryEntry
+    from .result_cache import ResultCache
+except ImportError:  # src/ itself is on sys.path
+    from calculator import Calculator, CalculatorMode
+    from history import History, HistoryEntry
+    from result_cache import ResultCache
+
+
+class SessionState:
+    """Per-session calculator state, kept much smaller than a Calculator"""
+    
+    __slots__ = ('memory', 'mode', 'last_result', 'history', 'last_access')
+    
+    def __init__(self, memory: float = 0.0, mode: CalculatorMode = CalculatorMode.BASIC,
+                 last_result: Optional[float] = None, history: Optional[History] = None):
+        self.memory = memory
+        self.mode = mode
+        self.last_result = last_result
+        # History is created on first use; most sessions never need one
+        self.history = history
+        self.last_access = 0.0
+
+
+class SessionManager:
+    """Lazily created calculator sessions with LRU and idle eviction
+
+    At most max_sessions sessions stay in memory. When a session is
+    evicted (least recently used first, or after idle_timeout seconds
+    without access) it is spilled to a shelve file at spill_path if one
+    is given, and reloaded transparently on its next access; without a
+    spill_path evicted sessions are discarded. Only the retained entries
+    of a session's History are spilled, so its streaming statistics
+    restart from those entries after a reload.
+
+    Session Histories are created with lazy_statistics, so they hold
+    only their entries until statistics are first requested. The manager
+    may be shared between threads; a single session's Calculator and
+    History should still only be used by one thread at a time.
+    """
+    
+    def __init__(self, max_sessions: int = 10000, idle_timeout: Optional[float] = None,
+                 spill_path: Optional[str] = None, history_size: int = 100,
+                 cache: Optional[ResultCache] = None):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.history_size = history_size
+        self.cache = cache
+        self._sessions: 'OrderedDict[str, SessionState]' = OrderedDict()
+        self._spill = shelve.open(spill_path) if spill_path else None
+        # Guards the session table and spill file; reentrant because
+        # session() and history() call back into _get_state
+        self._lock = threading.RLock()
+    
+    def _get_state(self, session_id: str) -> SessionState:
+        """Find, reload or create a session and mark it most recently used"""
+        with self._lock:
+            now = time.monotonic()
+            state = self._sessions.get(session_id)
+            if state is None:
+                state = self._load(session_id)
+                self._sessions[session_id] = state
+            else:
+                self._sessions.move_to_end(session_id)
+            state.last_access = now
+            
+            if len(self._sessions) > self.max_sessions:
+                self._evict(next(iter(self._sessions)))
+            if self.idle_timeout is not None:
+                self.evict_idle(now)
+            return state
+    
+    def _load(self, session_id: str) -> SessionState:
+        """Reload a spilled session, or create a new one"""
+        if self._spill is None or session_id not in self._spill:
+            return SessionState()
+        memory, mode, last_result, entries = self._spill.pop(session_id)
+        history = None
+        if entries is not None:
+            history = History(max_entries=self.history_size, lazy_statistics=True)
+            history.restore_entries(HistoryEntry(*entry) for entry in entries)
+        return SessionState(memory, CalculatorMode(mode), last_result, history)
+    
+    def _evict(self, session_id: str):
+        """Drop a session from memory, spilling it to disk if configured"""
+        state = self._sessions.pop(session_id)
+        if self._spill is None:
+            return
+        entries = None
+        if state.history is not None:
+            entries = [
+                (entry.timestamp, entry.operation, entry.operands, entry.result, entry.mode)
+                for entry in state.history.history
+            ]
+        self._spill[session_id] = (state.memory, state.mode.value, state.last_result, entries)
+    
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Evict sessions idle for longer than idle_timeout, returning the count"""
+        if self.idle_timeout is None:
+            return 0
+        now = time.monotonic() if now is None else now
+        evicted = 0
+        with self._lock:
+            # The OrderedDict is in access order, so idle sessions are at the front
+            while self._sessions:
+                session_id, state = next(iter(self._sessions.items()))
+                if now - state.last_access <= self.idle_timeout:
+                    break
+                self._evict(session_id)
+                evicted += 1
+        return evicted
+    
+    @contextmanager
+    def session(self, session_id: str) -> Iterator[Calculator]:
+        """Use a session's Calculator; its state is saved back on exit"""
+        state = self._get_state(session_id)
+        calculator = Calculator(cache=self.cache)
+        calculator.memory = state.memory
+        calculator.mode = state.mode
+        calculator.last_result = state.last_result
+        try:
+            yield calculator
+        finally:
+            with self._lock:
+                if self._sessions.get(session_id) is not state:
+                    # Evicted while in use: write back to the reloaded state
+                    state = self._get_state(session_id)
+                state.memory = calculator.memory
+                state.mode = calculator.mode
+                state.last_result = calculator.last_result
+    
+    def history(self, session_id: str) -> History:
+        """Get a session's History, creating it on first use"""
+        with self._lock:
+            state = self._get_state(session_id)
+            if state.history is None:
+                state.history = History(max_entries=self.history_size, lazy_statistics=True)
+            return state.history
+    
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._sessions or (self._spill is not None and session_id in self._spill)
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+    
+    def close(self):
+        """Spill all resident sessions and close the spill file"""
+        with self._lock:
+            if self._spill is None:
+                return
+            while self._sessions:
+                self._evict(next(iter(self._sessions)))
+            self._spill.close()
+            self._spill = None
@@ -0,0 +1,203 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+DataSource = Union[str, Iterable[float]]
+
+
+class RunningStats:
+    """Single-pass, mergeable summary of a numeric stream
+
+    The mean and variance use Welford's update and combine with Chan's
+    parallel formula. The sum uses Neumaier (improved Kahan)
+    compensation, so partial results from separate chunks or processes
+    can be merged without losing accuracy.
+    """
+    
+    __slots__ = ('count', 'mean', 'm2', '_sum', '_compensation', 'min', 'max')
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def _add_to_sum(self, value: float):
+        """Neumaier-compensated addition to the running sum"""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+    
+    def add(self, value: float):
+        """Add one value"""
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self._add_to_sum(value)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def update(self, values: Iterable[float]):
+        """Add every value from an iterable"""
+        for value in values:
+            self.add(value)
+    
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> 'RunningStats':
+        """Summarise an in-memory chunk"""
+        stats = cls()
+        stats.update(values)
+        return stats
+    
+    def merge(self, other: 'RunningStats'):
+        """Merge another partial result into this one"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+        else:
+            count = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / count
+            self.m2 += other.m2 + delta * delta * self.count * other.count / count
+            self.count = count
+        self._add_to_sum(other._sum)
+        self._add_to_sum(other._compensation)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    @property
+    def sum(self) -> float:
+        """Compensated sum of all values"""
+        return self._sum + self._compensation
+    
+    @property
+    def variance(self) -> float:
+        """Sample variance; NaN with fewer than two values"""
+        return self.m2 / (self.count - 1) if self.count > 1 else float('nan')
+    
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation; NaN with fewer than two values"""
+        return math.sqrt(self.variance)
+    
+    def result(self, operation: str) -> float:
+        """Get a statistic by operation name"""
+        if operation not in STATISTICS_OPERATIONS:
+            raise ValueError(f"Unsupported statistics operation: {operation}")
+        if self.count == 0 and operation != 'sum':
+            return float('nan')
+        if operation == 'mean':
+            return self.mean
+        return getattr(self, operation)
+
+
+STATISTICS_OPERATIONS = ('sum', 'mean', 'variance', 'stddev', 'min', 'max')
+
+_SCAN_SIZE = 65536
+
+
+def _iter_file_values(filename: str) -> Iterator[float]:
+    """Read numbers separated by whitespace or commas, line by line"""
+    with open(filename, 'r') as f:
+        for line in f:
+            for token in line.replace(',', ' ').split():
+                yield float(token)
+
+
+def split_ranges(filename: str, chunk_bytes: int, separator: bytes) -> Iterator[Tuple[int, int]]:
+    """Yield byte ranges of roughly chunk_bytes that start on a separator"""
+    size = os.path.getsize(filename)
+    start = 0
+    with open(filename, 'rb') as f:
+        while start < size:
+            boundary = size
+            offset = start + chunk_bytes
+            while offset < size:
+                f.seek(offset)
+                block = f.read(_SCAN_SIZE + len(separator) - 1)
+                found = block.find(separator)
+                if found >= 0:
+                    boundary = offset + found
+                    break
+                offset += _SCAN_SIZE
+            yield start, boundary
+            start = boundary
+
+
+def _summarise_range(filename: str, start: int, end: int) -> RunningStats:
+    """Read, parse and summarise the numbers in bytes [start, end) of a file"""
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return RunningStats.from_values(map(float, data.replace(b',', b' ').split()))
+
+
+def iter_chunks(source: DataSource, chunk_size: int = 65536) -> Iterator[List[float]]:
+    """Split a file path or iterable of numbers into lists of chunk_size values"""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    values = _iter_file_values(source) if isinstance(source, str) else iter(source)
+    while True:
+        chunk = list(islice(values, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def compute_statistics(source: DataSource, chunk_size: int = 65536,
+                       processes: Optional[int] = 1, chunk_bytes: int = 1 << 20) -> RunningStats:
+    """Summarise a file path or iterable of numbers in a single pass
+
+    Chunks are summarised independently and merged. With processes
+    other than 1 they are spread over a process pool (None means one
+    per CPU); at most two chunks per process are in flight. A file is
+    then split into byte ranges of about chunk_bytes on line boundaries
+    and each worker parses its own range, so the parent only ships
+    offsets; iterables are sent in chunks of chunk_size values.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be at least 1")
+    total = RunningStats()
+    processes = processes or os.cpu_count() or 1
+    
+    if processes == 1:
+        for chunk in iter_chunks(source, chunk_size):
+            total.update(chunk)
+        return total
+    
+    if isinstance(source, str):
+        jobs = ((_summarise_range, source, start, end)
+                for start, end in split_ranges(source, chunk_bytes, b'\n'))
+    else:
+        jobs = ((RunningStats.from_values, chunk) for chunk in iter_chunks(source, chunk_size))
+    
+    # Partial results are merged in job order so the result is deterministic
+    results = {}
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = {}
+        for number, (function, *args) in enumerate(jobs):
+            pending[executor.submit(function, *args)] = number
+            if len(pending) >= 2 * processes:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+        for future, number in pending.items():
+            results[number] = future.result()
+    for number in range(len(results)):
+        total.merge(results[number])
+    return total
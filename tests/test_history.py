@@ -1,9 +1,16 @@
 import pytest
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import patch, mock_open
-from history import History
+from history import History, HistoryEntry
+
+
+def _add_at(history, timestamps):
+    """Add one entry per epoch timestamp, with the clock mocked"""
+    with patch('history.time.time', side_effect=timestamps):
+        for i in range(len(timestamps)):
+            history.add_entry('+', [i, 1], i + 1)
 
 
 class TestHistoryBasics:
@@ -46,12 +53,25 @@ class TestAddEntry:
 
     def test_add_entry_timestamp_format(self, history):
         """Test that timestamp is in ISO format"""
-        with patch('history.datetime') as mock_datetime:
-            mock_datetime.now.return_value.isoformat.return_value = '2023-01-01T12:00:00'
+        with patch('history.time.time', return_value=1672574400.0):
             history.add_entry('+', [1, 1], 2.0)
             
             entry = history.history[0]
-            assert entry['timestamp'] == '2023-01-01T12:00:00'
+            assert entry['timestamp'] == '2023-01-01T12:00:00+00:00'
+
+    def test_entry_timestamp_attribute_is_epoch(self, history):
+        """Test that the timestamp attribute gives epoch seconds"""
+        history.add_entry('+', [1, 1], 2.0)
+        
+        entry = history.history[0]
+        assert isinstance(entry.timestamp, float)
+        assert entry['timestamp'] == datetime.fromtimestamp(entry.timestamp, timezone.utc).isoformat()
+
+    def test_add_entry_timestamps_never_go_backwards(self, history):
+        """Test that a wall clock step backwards keeps entries ordered"""
+        _add_at(history, [100.0, 90.0, 110.0])
+        
+        assert [entry.timestamp for entry in history.history] == [100.0, 100.0, 110.0]
 
     def test_add_entry_exceeds_max_entries(self):
         """Test that old entries are removed when max_entries is exceeded"""
@@ -68,6 +88,52 @@ class TestAddEntry:
         assert hist.history[1]['operation'] == '*'
 
 
+class TestHistoryEntry:
+    """Test the compact HistoryEntry representation"""
+
+    def test_operands_stored_as_tuple(self, history):
+        """Test that operands are stored as a tuple but read back as a list"""
+        operands = [2, 3]
+        history.add_entry('+', operands, 5.0)
+        
+        entry = history.history[0]
+        assert entry.operands == (2, 3)
+        assert entry['operands'] == [2, 3]
+        operands.append(4)
+        assert entry.operands == (2, 3)
+
+    def test_strings_are_interned(self, history):
+        """Test that operation and mode strings are shared between entries"""
+        history.add_entry(''.join(['s', 'in']), [30], 0.5, ''.join(['scien', 'tific']))
+        history.add_entry(''.join(['si', 'n']), [60], 0.866, ''.join(['scient', 'ific']))
+        
+        first, second = history.history
+        assert first.operation is second.operation
+        assert first.mode is second.mode
+
+    def test_dict_view(self, history):
+        """Test the dict-style view of an entry"""
+        history.add_entry('*', [4, 5], 20.0)
+        
+        entry = history.history[0]
+        data = entry.as_dict()
+        assert set(data) == {'timestamp', 'operation', 'operands', 'result', 'mode'}
+        assert dict(entry) == data
+        assert entry.get('result') == 20.0
+        assert entry.get('missing', 'default') == 'default'
+        with pytest.raises(KeyError):
+            entry['missing']
+
+    def test_from_dict_parses_iso_timestamp(self):
+        """Test building an entry from an exported dict"""
+        entry = HistoryEntry.from_dict({
+            'timestamp': '2023-01-01T12:00:00', 'operation': '+',
+            'operands': [1, 2], 'result': 3.0, 'mode': 'basic'
+        })
+        assert entry.timestamp == datetime(2023, 1, 1, 12, 0, 0).timestamp()
+        assert entry.operands == (1, 2)
+
+
 class TestGetRecentEntries:
     """Test get_recent_entries functionality"""
 
@@ -103,6 +169,32 @@ class TestGetRecentEntries:
         assert len(recent) == 0
 
 
+class TestEntriesBetween:
+    """Test entries_between functionality"""
+
+    def test_entries_between_inclusive_range(self, history):
+        """Test that both bounds are inclusive"""
+        _add_at(history, [10.0, 20.0, 30.0, 40.0])
+        
+        results = history.entries_between(20.0, 30.0)
+        assert [entry.timestamp for entry in results] == [20.0, 30.0]
+
+    def test_entries_between_open_bounds(self, history):
+        """Test that omitted bounds are unbounded"""
+        _add_at(history, [10.0, 20.0, 30.0])
+        
+        assert len(history.entries_between(end=20.0)) == 2
+        assert len(history.entries_between(start=20.0)) == 2
+        assert len(history.entries_between()) == 3
+
+    def test_entries_between_no_match(self, history):
+        """Test a range with no entries"""
+        _add_at(history, [10.0, 20.0])
+        
+        assert history.entries_between(11.0, 19.0) == []
+        assert history.entries_between(30.0, 40.0) == []
+
+
 class TestSearchOperations:
     """Test search_operations functionality"""
 
@@ -178,6 +270,81 @@ class TestGetStatistics:
         assert stats['min_result'] == 3.0
         assert stats['max_result'] == 10.0
         assert stats['most_used_operation'] == '+'  # appears twice
+        streaming = stats['streaming_statistics']
+        assert streaming['count'] == 4
+        assert streaming['median_result'] == 7.0
+        assert streaming['p99_result'] == 10.0
+        assert streaming['operations']['+']['count'] == 2
+        assert streaming['operations']['*']['median_result'] == 10.0
+
+    def test_get_statistics_scopes_do_not_mix(self):
+        """Test that retained and streaming figures each describe one set of entries"""
+        hist = History(max_entries=3)
+        for i in range(100):
+            hist.add_entry('+', [i, 0], float(i))
+        
+        stats = hist.get_statistics()
+        assert stats['total_calculations'] == 3
+        assert (stats['min_result'], stats['max_result']) == (97.0, 99.0)
+        streaming = stats['streaming_statistics']
+        assert streaming['count'] == 100
+        assert (streaming['min_result'], streaming['max_result']) == (0.0, 99.0)
+        assert streaming['operations']['+']['count'] == 100
+
+    def test_get_statistics_percentiles(self):
+        """Test percentiles over a larger history"""
+        hist = History(max_entries=1000)
+        for i in range(1, 1001):
+            hist.add_entry('+', [i, 0], float(i))
+        
+        stats = hist.get_statistics()['streaming_statistics']
+        assert abs(stats['median_result'] - 500) <= 20
+        assert abs(stats['p95_result'] - 950) <= 20
+        assert abs(stats['p99_result'] - 990) <= 20
+
+    def test_clear_history_resets_percentiles(self, history):
+        """Test that clearing history also clears the sketches"""
+        history.add_entry('+', [1, 2], 3.0)
+        history.clear_history()
+        history.add_entry('+', [5, 5], 10.0)
+        
+        assert history.get_statistics()['streaming_statistics']['median_result'] == 10.0
+
+    def test_merge_statistics(self):
+        """Test merging sketches from another History"""
+        first = History()
+        second = History()
+        for i in range(50):
+            first.add_entry('+', [i, 0], float(i))
+            second.add_entry('sqrt', [i], float(i + 50))
+        
+        first.merge_statistics(second)
+        stats = first.get_statistics()['streaming_statistics']
+        assert abs(stats['median_result'] - 50) <= 2
+        assert stats['operations']['sqrt']['count'] == 50
+
+    def test_merge_statistics_into_empty_history(self):
+        """Test fan-in merging into a History that retains no entries"""
+        parts = [History(), History()]
+        for i in range(10):
+            parts[0].add_entry('+', [i, 0], float(i))
+            parts[1].add_entry('*', [i, 1], float(i + 10))
+        
+        aggregate = History()
+        for part in parts:
+            aggregate.merge_statistics(part)
+        stats = aggregate.get_statistics()
+        assert 'total_calculations' not in stats
+        assert stats['streaming_statistics']['count'] == 20
+        assert stats['streaming_statistics']['max_result'] == 19.0
+
+    def test_sketch_buffer_is_bounded_by_max_entries(self):
+        """Test that pending sketch input never outgrows the history"""
+        hist = History(max_entries=10)
+        for i in range(500):
+            hist.add_entry('+', [i, 0], float(i))
+            assert hist._unsketched_count < 10
+        assert hist.get_statistics()['streaming_statistics']['count'] == 500
 
 
 class TestExportImportHistory:
@@ -198,6 +365,7 @@ class TestExportImportHistory:
         imported_data = json.loads(written_data)
         assert len(imported_data) == 2
         assert imported_data[0]['operation'] == '+'
+        assert imported_data[0]['timestamp'] == history.history[0]['timestamp']
 
     def test_import_history(self, history):
         """Test importing history from JSON file"""
@@ -214,6 +382,8 @@ class TestExportImportHistory:
         assert len(history.history) == 2
         assert history.history[0]['operation'] == '+'
         assert history.history[1]['operation'] == '*'
+        assert history.history[0].timestamp == datetime(2023, 1, 1, 12, 0, 0).timestamp()
+        assert len(history.entries_between(datetime(2023, 1, 1, 12, 0, 30).timestamp())) == 1
 
     def test_import_history_overwrites_existing(self, history):
         """Test that import overwrites existing history"""
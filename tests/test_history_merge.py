@@ -0,0 +1,99 @@
+import json
+from history import History, iter_history
+from history_merge import main, merge_histories, merge_history_files
+
+
+def _write(tmp_path, name, timestamps, operation='+'):
+    path = tmp_path / name
+    path.write_text(json.dumps([
+        {'timestamp': ts, 'operation': operation, 'operands': [i, 1],
+         'result': i + 1.0, 'mode': 'basic'}
+        for i, ts in enumerate(timestamps)
+    ]))
+    return str(path)
+
+
+def test_merge_orders_by_timestamp(tmp_path):
+    a = _write(tmp_path, 'a.json', ['2023-01-01T12:00:00', '2023-01-01T12:02:00'], '+')
+    b = _write(tmp_path, 'b.json', ['2023-01-01T12:01:00', '2023-01-01T12:03:00'], '*')
+
+    merged = list(merge_histories([a, b]))
+    assert [entry['operation'] for entry in merged] == ['+', '*', '+', '*']
+
+
+def test_merge_history_files_writes_json_lines(tmp_path):
+    a = _write(tmp_path, 'a.json', ['2023-01-01T12:00:00'])
+    b = _write(tmp_path, 'b.json', ['2023-01-01T12:01:00'])
+    output = str(tmp_path / 'merged.jsonl')
+
+    assert merge_history_files([a, b], output) == 2
+    lines = (tmp_path / 'merged.jsonl').read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1])['timestamp'] == '2023-01-01T12:01:00'
+
+
+def test_merge_truncates_to_most_recent(tmp_path):
+    a = _write(tmp_path, 'a.json', ['2023-01-01T12:00:00', '2023-01-01T12:02:00'])
+    b = _write(tmp_path, 'b.json', ['2023-01-01T12:01:00', '2023-01-01T12:03:00'])
+    output = str(tmp_path / 'merged.jsonl')
+
+    assert merge_history_files([a, b], output, max_entries=2) == 2
+    timestamps = [entry['timestamp'] for entry in iter_history(output)]
+    assert timestamps == ['2023-01-01T12:02:00', '2023-01-01T12:03:00']
+
+
+def test_merge_deduplicates_identical_entries(tmp_path):
+    a = _write(tmp_path, 'a.json', ['2023-01-01T12:00:00', '2023-01-01T12:01:00'])
+    b = _write(tmp_path, 'b.json', ['2023-01-01T12:00:00'])
+
+    assert len(list(merge_histories([a, b]))) == 3
+    assert len(list(merge_histories([a, b], deduplicate=True))) == 2
+
+
+def test_merged_output_imports_into_history(tmp_path):
+    a = _write(tmp_path, 'a.json', ['2023-01-01T12:00:00'])
+    b = _write(tmp_path, 'b.json', ['2023-01-01T12:01:00'], '*')
+    output = str(tmp_path / 'merged.jsonl')
+    main([output, a, b])
+
+    hist = History()
+    hist.import_history(output)
+    assert [entry.operation for entry in hist.history] == ['+', '*']
+
+
+def test_streaming_export_round_trip(tmp_path):
+    hist = History()
+    hist.add_entry('+', [1, 2], 3.0)
+    hist.add_entry('sqrt', [16], 4.0, 'scientific')
+    path = str(tmp_path / 'history.jsonl')
+    hist.export_history(path, streaming=True)
+
+    restored = History()
+    restored.import_history(path)
+    assert [entry.operation for entry in restored.history] == ['+', 'sqrt']
+    assert restored.history[1].mode == 'scientific'
+
+
+def test_merge_orders_across_utc_offsets(tmp_path):
+    a = _write(tmp_path, 'a.json', ['2023-01-01T12:00:00+00:00'], '+')
+    b = _write(tmp_path, 'b.json', ['2023-01-01T13:30:00+02:00'], '*')
+
+    merged = list(merge_histories([a, b]))
+    assert [entry['operation'] for entry in merged] == ['*', '+']
+
+
+def test_merge_deduplicates_same_instant_with_different_offsets(tmp_path):
+    a = _write(tmp_path, 'a.json', ['2023-01-01T12:00:00+00:00'])
+    b = _write(tmp_path, 'b.json', ['2023-01-01T14:00:00+02:00'])
+
+    assert len(list(merge_histories([a, b], deduplicate=True))) == 1
+
+
+def test_exported_timestamps_are_utc(tmp_path):
+    hist = History()
+    hist.add_entry('+', [1, 2], 3.0)
+    path = str(tmp_path / 'history.jsonl')
+    hist.export_history(path, streaming=True)
+
+    timestamp = next(iter_history(path))['timestamp']
+    assert timestamp.endswith('+00:00')
@@ -0,0 +1,38 @@
+import pytest
+from loadgen import generate_workload, run_load
+
+
+def test_seeded_workload_is_reproducible():
+    assert generate_workload(200, seed=7) == generate_workload(200, seed=7)
+    assert generate_workload(200, seed=7) != generate_workload(200, seed=8)
+
+
+def test_workload_follows_mix():
+    calls = generate_workload(100, mix={'memory': 1, 'stats_poll': 0}, seed=1)
+    assert {kind for kind, _ in calls} == {'memory'}
+
+
+def test_unknown_kind_raises():
+    with pytest.raises(ValueError, match="Unsupported workload kind: bogus"):
+        generate_workload(1, mix={'bogus': 1}, seed=1)
+
+
+def test_run_load_reports_percentiles():
+    report = run_load(700, workers=3, seed=3)
+    assert report['total_requests'] == 700
+    assert sum(stats['count'] for stats in report['operations'].values()) == 700
+    for stats in report['operations'].values():
+        assert stats['errors'] == 0
+        assert 0 <= stats['p50_ms'] <= stats['p99_ms'] <= stats['p999_ms'] <= stats['max_ms']
+
+
+def test_run_load_target_rate():
+    report = run_load(40, workers=2, rate=200, mix={'basic': 1}, seed=1)
+    # 40 calls at 200/s should take about 0.2s
+    assert report['elapsed_seconds'] >= 0.19
+    assert report['operations']['basic']['count'] == 40
+
+
+def test_run_load_with_processes():
+    report = run_load(100, workers=2, seed=5, processes=True)
+    assert sum(stats['count'] for stats in report['operations'].values()) == 100
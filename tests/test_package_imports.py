@@ -0,0 +1,7 @@
+import importlib
+import pytest
+
+
+@pytest.mark.parametrize("module", ['src.calculator', 'src.history', 'src.history_merge', 'src.loadgen', 'src.replay', 'src.sessions', 'src.streaming_stats'])
+def test_modules_import_from_repository_root(module):
+    assert importlib.import_module(module)
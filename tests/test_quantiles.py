@@ -0,0 +1,86 @@
+import random
+import pytest
+from quantiles import KLLSketch
+
+
+def _rank_error(values, estimate, q):
+    rank = sum(1 for v in values if v <= estimate) / len(values)
+    return abs(rank - q)
+
+
+def test_empty_sketch_returns_none():
+    sketch = KLLSketch()
+    assert sketch.quantile(0.5) is None
+    assert len(sketch) == 0
+
+
+def test_small_input_is_exact():
+    sketch = KLLSketch()
+    sketch.update([5.0, 1.0, 3.0, 2.0, 4.0])
+    assert sketch.quantile(0.5) == 3.0
+    assert sketch.quantile(0) == 1.0
+    assert sketch.quantile(1) == 5.0
+
+
+def test_batch_update_matches_single_adds():
+    values = [float(i % 997) for i in range(20_000)]
+    batched = KLLSketch(seed=4)
+    for start in range(0, len(values), 1024):
+        batched.update(values[start:start + 1024])
+
+    assert batched.count == len(values)
+    assert sum(len(items) for items in batched.compactors) < 1000
+    assert _rank_error(values, batched.quantile(0.5), 0.5) < 0.02
+
+
+def test_nan_is_ignored():
+    sketch = KLLSketch()
+    sketch.update([1.0, float('nan'), 2.0])
+    assert sketch.count == 2
+
+
+def test_large_stream_has_bounded_memory_and_error():
+    rng = random.Random(1)
+    values = [rng.gauss(0, 1) for _ in range(50_000)]
+    sketch = KLLSketch(k=200, seed=1)
+    sketch.update(values)
+
+    stored = sum(len(items) for items in sketch.compactors)
+    assert stored < 1000
+    assert sketch.count == len(values)
+    for q in (0.5, 0.95, 0.99):
+        assert _rank_error(values, sketch.quantile(q), q) < 0.02
+
+
+def test_merge_matches_combined_stream():
+    rng = random.Random(2)
+    values = [rng.uniform(0, 100) for _ in range(20_000)]
+    parts = [KLLSketch(seed=i) for i in range(4)]
+    for i, value in enumerate(values):
+        parts[i % 4].add(value)
+
+    merged = KLLSketch(seed=9)
+    for part in parts:
+        merged.merge(part)
+
+    assert merged.count == len(values)
+    assert merged.min == min(values)
+    assert merged.max == max(values)
+    for q in (0.5, 0.95, 0.99):
+        assert _rank_error(values, merged.quantile(q), q) < 0.02
+
+
+def test_invalid_quantile_raises():
+    sketch = KLLSketch()
+    sketch.add(1.0)
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        sketch.quantile(1.5)
+
+
+def test_ints_beyond_double_range_are_kept_as_infinity():
+    sketch = KLLSketch()
+    sketch.update([1, 10 ** 400, -(10 ** 400)])
+    sketch.add(10 ** 400)
+    assert sketch.max == float('inf')
+    assert sketch.min == float('-inf')
+    assert sketch.quantile(0.9) == float('inf')
@@ -0,0 +1,106 @@
+import json
+import pytest
+from history import History, iter_history
+from replay import replay_history, results_match
+
+
+def _export(tmp_path, entries):
+    path = tmp_path / 'history.json'
+    path.write_text(json.dumps(entries, indent=2))
+    return str(path)
+
+
+def _entry(operation, operands, result, mode='basic'):
+    return {'timestamp': '2023-01-01T12:00:00', 'operation': operation,
+            'operands': operands, 'result': result, 'mode': mode}
+
+
+def test_results_match_float_tolerance():
+    assert results_match(0.1 + 0.2, 0.3)
+    assert not results_match(0.3, 0.31)
+    assert results_match(float('nan'), float('nan'))
+    assert results_match(float('inf'), float('inf'))
+    assert not results_match(float('inf'), float('-inf'))
+    assert results_match('0b1010', '0b1010')
+    assert not results_match(3, 4)
+
+
+def test_iter_history_streams_across_chunks(tmp_path):
+    hist = History()
+    for i in range(50):
+        hist.add_entry('+', [i, 1], i + 1.0)
+    path = str(tmp_path / 'history.json')
+    hist.export_history(path)
+
+    entries = list(iter_history(path, chunk_size=16))
+    assert len(entries) == 50
+    assert entries[-1]['result'] == 50.0
+
+
+def test_iter_history_rejects_truncated_file(tmp_path):
+    path = tmp_path / 'history.json'
+    path.write_text('[{"operation": "+"}, ')
+    with pytest.raises(ValueError, match="Truncated"):
+        list(iter_history(str(path)))
+
+
+def test_replay_all_modes_match(tmp_path):
+    path = _export(tmp_path, [
+        _entry('+', [2, 3], 5),
+        _entry('/', [1, 0], float('inf')),
+        _entry('sqrt', [16.0], 4.0, 'scientific'),
+        _entry('sin', [30], 0.49999999999999994, 'scientific'),
+        _entry('bin', [10], '0b1010', 'programmer'),
+    ])
+    report = replay_history(path, processes=1)
+    assert report['total_entries'] == 5
+    assert report['matched_entries'] == 5
+    assert report['mismatches'] == []
+
+
+def test_replay_reports_mismatches_and_errors(tmp_path):
+    path = _export(tmp_path, [
+        _entry('+', [2, 3], 5),
+        _entry('*', [2, 3], 7),
+        _entry('bogus', [1, 2], 0),
+    ])
+    report = replay_history(path, processes=1)
+    assert report['matched_entries'] == 1
+    first, second = report['mismatches']
+    assert first['index'] == 1
+    assert first['actual'] == 6
+    assert second['index'] == 2
+    assert 'Unsupported operation' in second['error']
+
+
+def test_replay_process_pool_matches_serial(tmp_path):
+    entries = [_entry('*', [i, 2], i * 2) for i in range(200)]
+    entries[150]['result'] = -1
+    path = _export(tmp_path, entries)
+
+    report = replay_history(path, processes=2, chunk_bytes=2000)
+    assert report['total_entries'] == 200
+    assert [m['index'] for m in report['mismatches']] == [150]
+
+
+def test_replay_json_lines_in_byte_ranges(tmp_path):
+    path = tmp_path / 'history.jsonl'
+    entries = [_entry('+', [i, 1], i + 1) for i in range(100)]
+    entries[0]['result'] = 0
+    entries[99]['result'] = 0
+    path.write_text(''.join(json.dumps(entry) + '\n' for entry in entries))
+
+    report = replay_history(str(path), processes=1, chunk_bytes=500)
+    assert report['total_entries'] == 100
+    assert [m['index'] for m in report['mismatches']] == [0, 99]
+
+
+def test_replay_compact_array_decoded_by_parent(tmp_path):
+    path = tmp_path / 'history.json'
+    entries = [_entry('-', [i, 1], i - 1) for i in range(30)]
+    entries[20]['result'] = 0
+    path.write_text(json.dumps(entries))
+
+    report = replay_history(str(path), processes=1, chunk_bytes=1000)
+    assert report['total_entries'] == 30
+    assert [m['index'] for m in report['mismatches']] == [20]
@@ -0,0 +1,115 @@
+import math
+import threading
+import pytest
+from calculator import Calculator
+from result_cache import ResultCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'results.db')
+
+
+def test_expression_hits_after_restart(cache_path):
+    first = Calculator(cache=ResultCache(cache_path))
+    assert first.evaluate_expression("2 + 3 * 4") == 14.0
+    first.cache.close()
+
+    cache = ResultCache(cache_path)
+    second = Calculator(cache=cache)
+    assert second.evaluate_expression("2+3*4") == 14.0
+    assert second.get_last_result() == 14.0
+    stats = cache.get_statistics()
+    assert stats['hits'] == 1
+    assert stats['hit_ratio'] == 1.0
+    assert stats['first_hit_latency'] is not None
+
+
+def test_scientific_results_are_shared(cache_path):
+    writer = Calculator(cache=ResultCache(cache_path))
+    reader = Calculator(cache=ResultCache(cache_path))
+
+    expected = writer.scientific_operations(20.0, 'factorial')
+    assert reader.scientific_operations(20.0, 'factorial') == expected
+    assert reader.cache.hits == 1
+
+
+def test_nan_results_round_trip(cache_path):
+    calc = Calculator(cache=ResultCache(cache_path))
+    calc.scientific_operations(2.5, 'factorial')
+    assert math.isnan(calc.scientific_operations(2.5, 'factorial'))
+    assert calc.cache.hits == 1
+
+
+def test_errors_are_not_cached(cache_path):
+    calc = Calculator(cache=ResultCache(cache_path))
+    with pytest.raises(ValueError):
+        calc.evaluate_expression("1/0")
+    with pytest.raises(ValueError):
+        calc.scientific_operations(1, 'bogus')
+    assert len(calc.cache) == 0
+
+
+def test_eviction_bounds_size(cache_path):
+    cache = ResultCache(cache_path, max_entries=5)
+    for i in range(20):
+        cache.put(f"k{i}", i)
+    assert len(cache) == 5
+    assert cache.get("k0") is None
+    assert cache.get("k19") == 19
+
+
+def test_version_change_invalidates(cache_path):
+    cache = ResultCache(cache_path, version="1")
+    cache.put("k", 1.0)
+    cache.close()
+
+    assert ResultCache(cache_path, version="1").get("k") == 1.0
+    assert ResultCache(cache_path, version="2").get("k") is None
+
+
+def test_expression_key_follows_the_parse():
+    assert ResultCache.expression_key(" 1 +  2 ") == ResultCache.expression_key("1+2")
+    assert ResultCache.expression_key("2*3") != ResultCache.expression_key("2**3")
+    with pytest.raises(SyntaxError):
+        ResultCache.expression_key("1 2")
+
+
+def test_warm_cache_does_not_change_expression_meaning(cache_path):
+    calc = Calculator(cache=ResultCache(cache_path))
+    assert calc.evaluate_expression("12") == 12.0
+    assert calc.evaluate_expression("1.5") == 1.5
+    with pytest.raises(ValueError, match="Invalid expression"):
+        calc.evaluate_expression("1 2")
+    with pytest.raises(ValueError, match="Invalid expression"):
+        calc.evaluate_expression("1 .5")
+
+
+def test_shared_cache_is_thread_safe(cache_path):
+    cache = ResultCache(cache_path, max_entries=50)
+    errors = []
+
+    def worker(n):
+        calc = Calculator(cache=cache)
+        try:
+            for i in range(200):
+                calc.scientific_operations(float((n * 200 + i) % 70), 'factorial')
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert cache.hits + cache.misses == 1600
+
+
+def test_cheap_operations_skip_the_cache(cache_path):
+    calc = Calculator(cache=ResultCache(cache_path))
+    for operation in ('sin', 'cos', 'tan', 'log', 'ln', 'sqrt', 'exp'):
+        calc.scientific_operations(30, operation)
+        calc.scientific_operations(30, operation)
+    assert calc.cache.hits + calc.cache.misses == 0
+    assert len(calc.cache) == 0
@@ -15,6 +15,60 @@ def test_trigonometric_operations(calculator):
     assert round(calculator.scientific_operations(45, 'tan'), 4) == 1.0  # tan(45°) = 1
     assert round(calculator.scientific_operations(0, 'tan'), 4) == 0.0   # tan(0°) = 0
 
+@pytest.mark.parametrize("angle, sin, cos", [
+    (0, 0.0, 1.0),
+    (30, 0.5, math.sqrt(3) / 2),
+    (90, 1.0, 0.0),
+    (150, 0.5, -math.sqrt(3) / 2),
+    (180, 0.0, -1.0),
+    (210, -0.5, -math.sqrt(3) / 2),
+    (270, -1.0, 0.0),
+    (360, 0.0, 1.0),
+    (-30, -0.5, math.sqrt(3) / 2),
+    (360 * 10**12 + 30, 0.5, math.sqrt(3) / 2),
+])
+def test_trigonometric_special_angles_are_exact(calculator, angle, sin, cos):
+    assert calculator.scientific_operations(angle, 'sin') == sin
+    assert calculator.scientific_operations(angle, 'cos') == cos
+
+
+def test_tangent_special_angles_and_poles(calculator):
+    assert calculator.scientific_operations(45, 'tan') == 1.0
+    assert calculator.scientific_operations(135, 'tan') == -1.0
+    assert calculator.scientific_operations(180, 'tan') == 0.0
+    assert calculator.scientific_operations(60, 'tan') == math.sqrt(3)
+    assert calculator.scientific_operations(90, 'tan') == float('inf')
+    assert calculator.scientific_operations(270, 'tan') == float('-inf')
+    assert calculator.scientific_operations(-90, 'tan') == float('-inf')
+    assert math.isnan(calculator.scientific_operations(float('nan'), 'tan'))
+
+
+def test_trigonometric_large_angles_reduce_exactly(calculator):
+    # 1e17 degrees is 280 degrees modulo 360
+    assert calculator.scientific_operations(1e17, 'sin') == pytest.approx(math.sin(math.radians(280)))
+    assert calculator.scientific_operations(37.5 + 360 * 2**40, 'cos') == pytest.approx(math.cos(math.radians(37.5)))
+
+
+def test_trigonometric_huge_ints_reduce_exactly(calculator):
+    # 10**20 + 30 is above 2**53, so converting it to float first would
+    # lose the angle; exactly it is 310 degrees modulo 360
+    value = 10**20 + 30
+    assert calculator.scientific_operations(value, 'sin') == pytest.approx(math.sin(math.radians(310)))
+    assert calculator.scientific_operations(-value, 'sin') == pytest.approx(math.sin(math.radians(-310)))
+    assert calculator.scientific_batch([1.0, value], 'sin')[1] == pytest.approx(math.sin(math.radians(310)))
+
+
+def test_scientific_batch_matches_scalar(calculator):
+    values = [0, 30, 45, 90, 123.456, -270, 1e17, 1e-9, float('nan')]
+    for operation in ('sin', 'cos', 'tan', 'sqrt'):
+        for batch_values in (values, [float(v) for v in values]):
+            batch = calculator.scientific_batch(batch_values, operation)
+            scalar = [calculator.scientific_operations(v, operation) for v in batch_values]
+            assert all(a == b or (math.isnan(a) and math.isnan(b)) for a, b in zip(batch, scalar))
+    assert math.isnan(calculator.get_last_result())
+    assert calculator.scientific_batch([], 'sin') == []
+
+
 def test_logarithmic_operations(calculator):
     # Test log (base 10)
     assert calculator.scientific_operations(100, 'log') == 2.0  # log10(100) = 2
@@ -0,0 +1,143 @@
+import sys
+import threading
+
+import pytest
+from calculator import CalculatorMode
+from sessions import SessionManager
+
+
+def test_sessions_are_created_lazily_and_isolated():
+    manager = SessionManager()
+    assert 'alice' not in manager
+
+    with manager.session('alice') as calc:
+        calc.memory_operations('store', 5.0)
+        calc.set_mode(CalculatorMode.SCIENTIFIC)
+        calc.basic_operations(2, 3, '+')
+    with manager.session('bob') as calc:
+        assert calc.memory == 0.0
+
+    with manager.session('alice') as calc:
+        assert calc.memory == 5.0
+        assert calc.mode == CalculatorMode.SCIENTIFIC
+        assert calc.get_last_result() == 5
+    assert len(manager) == 2
+
+
+def test_history_is_per_session():
+    manager = SessionManager(history_size=3)
+    manager.history('alice').add_entry('+', [1, 2], 3.0)
+
+    assert len(manager.history('alice').history) == 1
+    assert len(manager.history('bob').history) == 0
+    assert manager.history('alice').max_entries == 3
+
+
+def test_lru_eviction_without_spill_discards_state():
+    manager = SessionManager(max_sessions=2)
+    for session_id in ('a', 'b'):
+        with manager.session(session_id) as calc:
+            calc.memory_operations('store', 1.0)
+    with manager.session('a'):
+        pass
+    with manager.session('c'):
+        pass
+
+    assert 'b' not in manager
+    assert 'a' in manager
+    with manager.session('b') as calc:
+        assert calc.memory == 0.0
+
+
+def test_state_written_while_evicted_is_kept(tmp_path):
+    for spill_path in (None, str(tmp_path / 'sessions')):
+        manager = SessionManager(max_sessions=1, spill_path=spill_path)
+        with manager.session('a') as calc:
+            manager.history('b')
+            calc.memory_operations('store', 9.0)
+        with manager.session('a') as calc:
+            assert calc.memory == 9.0
+
+
+def test_evicted_sessions_spill_and_reload(tmp_path):
+    manager = SessionManager(max_sessions=1, spill_path=str(tmp_path / 'sessions'))
+    with manager.session('a') as calc:
+        calc.memory_operations('store', 7.0)
+        calc.set_mode(CalculatorMode.PROGRAMMER)
+    manager.history('a').add_entry('sqrt', [16], 4.0, 'scientific')
+    with manager.session('b'):
+        pass
+
+    assert len(manager) == 1
+    assert 'a' in manager
+    with manager.session('a') as calc:
+        assert calc.memory == 7.0
+        assert calc.mode == CalculatorMode.PROGRAMMER
+    history = manager.history('a')
+    assert history.history[0].operation == 'sqrt'
+    assert history.get_statistics()['streaming_statistics']['median_result'] == 4.0
+    manager.close()
+
+
+def test_idle_sessions_are_evicted(tmp_path):
+    manager = SessionManager(idle_timeout=10.0, spill_path=str(tmp_path / 'sessions'))
+    with manager.session('a') as calc:
+        calc.memory_operations('store', 3.0)
+    with manager.session('b'):
+        pass
+
+    last_access = manager._sessions['b'].last_access
+    assert manager.evict_idle(last_access + 5.0) == 0
+    assert manager.evict_idle(last_access + 60.0) == 2
+    assert len(manager) == 0
+    with manager.session('a') as calc:
+        assert calc.memory == 3.0
+    manager.close()
+
+
+def test_session_histories_create_sketches_on_first_statistics():
+    manager = SessionManager()
+    history = manager.history('alice')
+    history.add_entry('+', [1, 2], 3.0)
+    history.add_entry('*', [2, 5], 10.0)
+    assert history.result_sketch is None
+
+    stats = history.get_statistics()
+    assert stats['total_calculations'] == 2
+    assert stats['streaming_statistics']['count'] == 2
+    assert history.result_sketch is not None
+
+
+def test_concurrent_sessions_with_eviction():
+    manager = SessionManager(max_sessions=50)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(2000):
+                session_id = f"user{(offset * 37 + i) % 200}"
+                with manager.session(session_id) as calc:
+                    calc.memory_operations('add', 1.0)
+                manager.history(session_id).add_entry('+', [i, 1], i + 1.0)
+        except Exception as error:
+            errors.append(error)
+
+    # Switch threads very often so unguarded table updates would interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert len(manager) <= 50
+
+
+def test_invalid_max_sessions():
+    with pytest.raises(ValueError, match="max_sessions"):
+        SessionManager(max_sessions=0)
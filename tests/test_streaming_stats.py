@@ -0,0 +1,79 @@
+import math
+import random
+import statistics
+import pytest
+from calculator import CalculatorMode
+from streaming_stats import RunningStats, compute_statistics, iter_chunks
+
+
+def test_statistics_operations(calculator):
+    calculator.set_mode(CalculatorMode.STATISTICS)
+    data = [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]
+    assert calculator.statistics_operations(data, 'sum') == 40.0
+    assert calculator.statistics_operations(data, 'mean') == 5.0
+    assert calculator.statistics_operations(data, 'variance') == pytest.approx(statistics.variance(data))
+    assert calculator.statistics_operations(data, 'stddev') == pytest.approx(statistics.stdev(data))
+    assert calculator.statistics_operations(data, 'min') == 2.0
+    assert calculator.statistics_operations(iter(data), 'max') == 9.0
+    assert calculator.get_last_result() == 9.0
+
+
+def test_statistics_operations_from_file(calculator, tmp_path):
+    path = tmp_path / 'data.txt'
+    path.write_text("1, 2 3\n4\n\n5,6\n")
+    assert calculator.statistics_operations(str(path), 'mean', chunk_size=2) == 3.5
+
+
+def test_statistics_operations_empty_and_invalid(calculator):
+    assert calculator.statistics_operations([], 'sum') == 0.0
+    assert math.isnan(calculator.statistics_operations([], 'mean'))
+    assert math.isnan(calculator.statistics_operations([1.0], 'variance'))
+    with pytest.raises(ValueError, match="Unsupported statistics operation: median"):
+        calculator.statistics_operations([1.0], 'median')
+
+
+def test_sum_is_compensated():
+    data = [1e16, 1.0, -1e16] * 1000
+    stats = RunningStats.from_values(data)
+    assert stats.sum == 1000.0
+
+
+def test_variance_is_stable_with_large_offset():
+    data = [1e9 + x for x in (4.0, 7.0, 13.0, 16.0)]
+    assert RunningStats.from_values(data).variance == pytest.approx(30.0)
+
+
+def test_merged_chunks_match_single_pass():
+    rng = random.Random(3)
+    data = [rng.gauss(100, 15) for _ in range(10_000)]
+    merged = RunningStats()
+    for chunk in iter_chunks(data, 777):
+        merged.merge(RunningStats.from_values(chunk))
+    single = RunningStats.from_values(data)
+
+    assert merged.count == single.count
+    assert merged.sum == pytest.approx(math.fsum(data))
+    assert merged.mean == pytest.approx(single.mean)
+    assert merged.variance == pytest.approx(single.variance)
+    assert (merged.min, merged.max) == (min(data), max(data))
+
+
+def test_compute_statistics_process_pool():
+    data = [float(i) for i in range(5000)]
+    stats = compute_statistics(data, chunk_size=500, processes=2)
+    assert stats.count == 5000
+    assert stats.sum == math.fsum(data)
+    assert stats.variance == pytest.approx(statistics.variance(data))
+
+
+def test_compute_statistics_process_pool_splits_files(tmp_path):
+    data = [float(i) / 7 for i in range(3000)]
+    path = tmp_path / 'data.txt'
+    path.write_text("\n".join(", ".join(repr(value) for value in data[i:i + 10])
+                              for i in range(0, len(data), 10)) + "\n")
+    stats = compute_statistics(str(path), processes=2, chunk_bytes=1000)
+    single = compute_statistics(str(path))
+    assert stats.count == single.count == 3000
+    assert stats.sum == pytest.approx(math.fsum(data))
+    assert stats.variance == pytest.approx(single.variance)
+    assert (stats.min, stats.max) == (min(data), max(data))